@@ -1,20 +1,116 @@
 import os
 import json
-import vdf
+import mmap
+import re
 import subprocess
 import msvcrt
 import sys
 import ctypes
-import psutil
+import functools
+import io
+import queue
+import threading
 import time
-import winreg
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime, timedelta
 from pathlib import Path
 from colorama import init, Fore, Style
 
-# Initialize colorama for Windows support
+# psutil, vdf and winreg are imported inside the functions that use them, so
+# startup doesn't pay for modules a session may never touch
+
+# Initialize colorama for Windows support. It already strips escapes when output is
+# redirected and leaves stdout unwrapped on consoles that understand them
 init()
 
+# orjson is optional; when it's installed it serializes the config much faster.
+# Both paths use a two-space indent so the file looks the same either way
+try:
+    import orjson
+
+    def _dump_config(config):
+        """Serialize the config for writing to disk"""
+        return orjson.dumps(config, option=orjson.OPT_INDENT_2).decode('utf-8')
+except ImportError:
+    def _dump_config(config):
+        """Serialize the config for writing to disk"""
+        return json.dumps(config, indent=2)
+
+# Set STEAMY_VERBOSE=1 to see per-item progress while scanning and saving
+VERBOSE = os.environ.get('STEAMY_VERBOSE') == '1'
+
+def _log(msg):
+    """Print a diagnostic message when running in verbose mode"""
+    if VERBOSE:
+        print(msg)
+
+# Menu frame pieces, built once instead of on every redraw
+_HR = '─' * 118
+_MENU_TOP = f"{Fore.BLUE}┌{_HR}"
+_MENU_MID = f"├{_HR}"
+_MENU_BOT = f"└{_HR}"
+_BLANK_ROW = f"│{' ' * 118}"
+_MENU_MID_BLUE = f"{Fore.BLUE}{_MENU_MID}"
+_MENU_END = f"{_MENU_BOT}{Style.RESET_ALL}"
+
+# Fixed title and message rows
+_SETTINGS_TITLE = f"│{' ' * 45}{Fore.WHITE}SETTINGS MENU{Style.RESET_ALL}{' ' * 55}"
+_LIBRARY_TITLE = f"│{' ' * 45}{Fore.WHITE}LIBRARY PATH MANAGEMENT{Style.RESET_ALL}{' ' * 45}"
+_USER_TITLE = f"│{' ' * 45}{Fore.WHITE}SELECT STEAM USER{Style.RESET_ALL}{' ' * 55}"
+_GAMES_HEADER = f"│ {Fore.BLUE}Installed Games{' ' * 100}"
+_WELCOME_ROWS = (
+    _BLANK_ROW,
+    f"│{' ' * 35}{Fore.YELLOW}Welcome to Steamy!{Style.RESET_ALL}{' ' * 65}",
+    f"│{' ' * 25}{Fore.WHITE}To get started, configure your Steam libraries using the options below.{Style.RESET_ALL}{' ' * 25}",
+    f"│{' ' * 30}{Fore.WHITE}Press [S] for Settings or [A] to Auto-detect libraries.{Style.RESET_ALL}{' ' * 35}",
+    _BLANK_ROW,
+)
+_SELECT_USER_ROWS = (
+    _BLANK_ROW,
+    f"│{' ' * 35}{Fore.YELLOW}Almost there!{Style.RESET_ALL}{' ' * 65}",
+    f"│{' ' * 25}{Fore.WHITE}Please select a Steam user to continue.{Style.RESET_ALL}{' ' * 45}",
+    _BLANK_ROW,
+)
+_NO_GAMES_ROWS = (
+    _BLANK_ROW,
+    f"│{' ' * 25}{Fore.RED}No games found in your configured libraries.{Style.RESET_ALL}{' ' * 45}",
+    f"│{' ' * 25}{Fore.WHITE}Press [R] to refresh or [S] to check library paths in Settings.{Style.RESET_ALL}{' ' * 30}",
+    _BLANK_ROW,
+)
+
+# Game session monitor box pieces
+_MONITOR_TOP = f"{Fore.BLUE}╔{'═' * 50}╗"
+_MONITOR_SEP = f"╠{'═' * 50}╣"
+_MONITOR_BOT = f"╚{'═' * 50}╝{Style.RESET_ALL}"
+_MONITOR_TITLE = f"║{' ' * 15}{Fore.CYAN}Game Session Monitor{Fore.BLUE}{' ' * 16}║"
+_MONITOR_TIME_HEADER = f"║ {Fore.CYAN}Time Tracking{' ' * 38}{Fore.BLUE}║"
+_MONITOR_PERF_HEADER = f"║ {Fore.CYAN}Performance Metrics{' ' * 33}{Fore.BLUE}║"
+_MONITOR_CONTROLS = (
+    _MONITOR_SEP,
+    f"║ {Fore.CYAN}Controls{' ' * 42}{Fore.BLUE}║",
+    f"║ {Fore.YELLOW}[Q]{Fore.WHITE} Force quit game{' ' * 33}{Fore.BLUE}║",
+    f"║ {Fore.YELLOW}[K]{Fore.WHITE} Kill game process{' ' * 31}{Fore.BLUE}║",
+    f"║ {Fore.YELLOW}[R]{Fore.WHITE} Refresh stats{' ' * 35}{Fore.BLUE}║",
+    f"║ {Fore.YELLOW}[B]{Fore.WHITE} Back to menu{' ' * 36}{Fore.BLUE}║",
+    _MONITOR_BOT,
+)
+_SESSION_ENDED_TITLE = f"║{' ' * 15}{Fore.CYAN}Game Session Ended{Fore.BLUE}{' ' * 17}║"
+_SESSION_ENDED_FOOTER = f"║{' ' * 50}║\n║ {Fore.CYAN}Hope you enjoyed playing!{' ' * 27}{Fore.BLUE}║\n{_MONITOR_BOT}"
+
+# What a monitor key handler asks the monitor loop to do next
+_MONITOR_EXIT = 'exit'
+_MONITOR_REDRAW = 'redraw'
+
+# Screen row of the first option in the list menus (top border, blank, title, blank, divider)
+_MENU_FIRST_ROW = 6
+_NAV_PROMPT = "Use arrow keys to navigate, Enter to select: "
+
+# Quick action bars for the main menu, before and after libraries are configured
+_QUICK_ACTIONS_SETUP = f"│ {Fore.YELLOW}[S]{Style.RESET_ALL} Settings | {Fore.YELLOW}[A]{Style.RESET_ALL} Auto-detect | {Fore.YELLOW}[Q]{Style.RESET_ALL} Quit"
+_QUICK_ACTIONS = f"│ {Fore.YELLOW}[S]{Style.RESET_ALL} Settings | {Fore.YELLOW}[R]{Style.RESET_ALL} Refresh | {Fore.YELLOW}[Q]{Style.RESET_ALL} Quit"
+
 def set_console_size(width, height):
     """Set the console window size"""
     try:
@@ -46,6 +142,95 @@ def set_console_title(title):
         print(f"{Fore.RED}Error setting console title: {str(e)}{Style.RESET_ALL}")
     return False
 
+# Cursor home followed by erase display
+_CLEAR_SCREEN = '\x1b[H\x1b[2J'
+
+def clear_screen():
+    """Clear the console using ANSI escapes instead of spawning a cls/clear shell"""
+    # colorama translates these to console API calls on older Windows consoles
+    sys.stdout.write(_CLEAR_SCREEN)
+    sys.stdout.flush()
+
+def enable_vt_mode():
+    """Enable ANSI escape sequence processing on the Windows console"""
+    try:
+        ENABLE_VIRTUAL_TERMINAL_PROCESSING = 0x0004
+        STD_OUTPUT_HANDLE = -11
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.GetStdHandle(STD_OUTPUT_HANDLE)
+        mode = ctypes.c_uint32()
+        if kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+            return bool(kernel32.SetConsoleMode(handle, mode.value | ENABLE_VIRTUAL_TERMINAL_PROCESSING))
+    except Exception as e:
+        print(f"{Fore.RED}Error enabling VT mode: {str(e)}{Style.RESET_ALL}")
+    return False
+
+def _write_frame(lines):
+    """Clear the screen and write a full menu frame with a single stdout write"""
+    sys.stdout.write(_CLEAR_SCREEN + '\n'.join(lines))
+    sys.stdout.flush()
+
+@contextmanager
+def batched_stdout():
+    """Collect everything printed inside the block and write it out in one go"""
+    original = sys.stdout
+    sys.stdout = buffer = io.StringIO()
+    try:
+        yield
+    finally:
+        sys.stdout = original
+        original.write(buffer.getvalue())
+        original.flush()
+
+def _redraw_selection(option_rows, selected_rows, previous, current):
+    """Repaint only the rows whose highlight changed, then park the cursor back at the prompt"""
+    out = []
+    for i in (previous, current):
+        row = selected_rows[i] if i == current else option_rows[i]
+        out.append(f"\x1b[{_MENU_FIRST_ROW + i};1H{Style.RESET_ALL}{row}")
+    # The prompt sits below the bottom border and a blank line
+    prompt_row = _MENU_FIRST_ROW + len(option_rows) + 2
+    out.append(f"\x1b[{prompt_row};{len(_NAV_PROMPT) + 1}H")
+    sys.stdout.write(''.join(out))
+    sys.stdout.flush()
+
+def _update_frame(previous, lines):
+    """Rewrite only the rows that differ from the previous frame, redrawing fully if the layout changed"""
+    if len(previous) != len(lines):
+        sys.stdout.write(_CLEAR_SCREEN + '\n'.join(lines) + '\n')
+    else:
+        out = []
+        for row, (old, line) in enumerate(zip(previous, lines), 1):
+            if old != line:
+                # Rows rely on the border colour carried over from the row above, so set it explicitly
+                out.append(f"\x1b[{row};1H{Fore.BLUE}{line}\x1b[K")
+        # Leave the cursor below the frame, where a full redraw would have left it
+        out.append(f"{Style.RESET_ALL}\x1b[{len(lines) + 1};1H")
+        sys.stdout.write(''.join(out))
+    sys.stdout.flush()
+
+def _listen_for_keys(keys, stop):
+    """Forward console key presses to a queue until asked to stop"""
+    # Poll rather than block in getwch, so no key is swallowed once the caller moves on
+    while not stop.is_set():
+        if msvcrt.kbhit():
+            key = msvcrt.getwch()
+            if key in ('\xe0', '\x00'):
+                # Arrow and navigation keys arrive as a prefix plus a letter; pass them on
+                # by name so the letter is never mistaken for a plain key press
+                key = _KEY_MAP.get(msvcrt.getwch().encode('latin-1'))
+                if not key:
+                    continue
+            keys.put(key)
+        else:
+            stop.wait(0.02)
+
+def _format_game_cell(index, game, selected):
+    """Format one entry of the main menu's game grid"""
+    color = Fore.CYAN if selected else Fore.WHITE
+    marker = '>' if selected else ' '
+    return f"{color}{marker} {index + 1:2d}. {game['display']}{Style.RESET_ALL}"
+
 def get_documents_path():
     """Get the path to the user's Documents folder"""
     try:
@@ -70,21 +255,178 @@ def get_config_path():
         os.makedirs(steamy_folder, exist_ok=True)
         # Config file path
         config_path = os.path.join(steamy_folder, "steamy_config.json")
-        print(f"{Fore.CYAN}Config path: {config_path}{Style.RESET_ALL}")
+        _log(f"{Fore.CYAN}Config path: {config_path}{Style.RESET_ALL}")
         return config_path
     except Exception as e:
         print(f"{Fore.RED}Error setting up config path: {str(e)}{Style.RESET_ALL}")
         # Fallback to local config if Documents folder is not accessible
         return "steamy_config.json"
 
+def _present_drives():
+    """Get the letters of the drives currently mounted on the system"""
+    try:
+        # Bit 0 is drive A, bit 1 is drive B, and so on
+        mask = ctypes.windll.kernel32.GetLogicalDrives()
+        return [chr(ord('A') + i) for i in range(26) if mask & (1 << i)]
+    except Exception as e:
+        print(f"{Fore.RED}Error getting logical drives: {str(e)}{Style.RESET_ALL}")
+        return list('ABCDEFGHIJKLMNOPQRSTUVWXYZ')
+
+def _get_steam_path_from_registry():
+    """Get Steam's install folder from the registry, or None if it isn't registered"""
+    import winreg
+    for subkey in (r"SOFTWARE\WOW6432Node\Valve\Steam", r"SOFTWARE\Valve\Steam"):
+        try:
+            with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, subkey) as key:
+                return winreg.QueryValueEx(key, "InstallPath")[0]
+        except OSError:
+            continue
+    return None
+
+def _get_steam_exe_from_registry():
+    """Get the Steam executable the current user's Steam client registered, or None"""
+    import winreg
+    try:
+        with winreg.OpenKey(winreg.HKEY_CURRENT_USER, r"Software\Valve\Steam") as key:
+            # Steam stores this with forward slashes
+            return os.path.normpath(winreg.QueryValueEx(key, "SteamExe")[0])
+    except OSError:
+        return None
+
+# Second byte of the arrow key sequences returned by msvcrt.getch
+_KEY_MAP = {b'H': 'UP', b'P': 'DOWN', b'K': 'LEFT', b'M': 'RIGHT'}
+
+# Common library locations relative to a drive root, with the lowercased
+# top-level folder each one lives under
+_STEAM_LIBRARY_SUFFIXES = [
+    (suffix.split('\\', 1)[0].lower(), suffix) for suffix in (
+        r"Steam\steamapps",
+        r"Program Files (x86)\Steam\steamapps",
+        r"Program Files\Steam\steamapps",
+        r"SteamLibrary\steamapps",
+        r"Steam Library\steamapps"
+    )
+]
+
+# Common Steam install locations, formatted with a drive letter
+_STEAM_EXE_TEMPLATES = [
+    r"{}:\Steam\steam.exe",
+    r"{}:\Program Files (x86)\Steam\steam.exe",
+    r"{}:\Program Files\Steam\steam.exe"
+]
+
+# Targeted scanners for the few VDF fields we need, much cheaper than a full vdf.load
+_APPMANIFEST_RE = re.compile(rb'"(name|appid|installdir)"\s+"((?:[^"\\]|\\.)*)"')
+_PERSONA_RE = re.compile(rb'"PersonaName"\s+"((?:[^"\\]|\\.)*)"')
+_VDF_ESCAPE_RE = re.compile(r'\\(.)')
+_VDF_ESCAPES = {'n': '\n', 't': '\t', 'r': '\r'}
+
+def _vdf_unescape(value):
+    """Decode a raw VDF string value, resolving backslash escapes"""
+    text = value.decode('utf-8', 'replace')
+    if '\\' not in text:
+        return text
+    return _VDF_ESCAPE_RE.sub(lambda m: _VDF_ESCAPES.get(m.group(1), m.group(1)), text)
+
+# Parsed results are cached by (path, mtime), so unchanged files are never re-read.
+# Callers must treat the returned values as read-only
+@functools.lru_cache(maxsize=1024)
+def _read_app_manifest(path, mtime):
+    """Get the name, appid and installdir fields of an appmanifest file"""
+    # Map the file and scan it in place, skipping the buffered read and its copy
+    fields = {}
+    fd = os.open(path, os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+    try:
+        size = os.fstat(fd).st_size
+        if size:
+            with mmap.mmap(fd, size, access=mmap.ACCESS_READ) as data:
+                # The fields sit at the top of AppState, so stop once all three are seen
+                # instead of scanning the depot and user config sections below them
+                for match in _APPMANIFEST_RE.finditer(data):
+                    key = match.group(1).decode()
+                    if key not in fields:
+                        fields[key] = _vdf_unescape(match.group(2))
+                        if len(fields) == 3:
+                            break
+    finally:
+        os.close(fd)
+    if 'name' in fields and 'appid' in fields:
+        return fields
+    # Fall back to the full parser for anything the scanner doesn't understand
+    import vdf
+    with open(path, 'r', encoding='utf-8') as f:
+        return vdf.load(f).get('AppState', {})
+
+@functools.lru_cache(maxsize=256)
+def _read_persona_name(path, mtime):
+    """Get the PersonaName from a localconfig.vdf file, or None if it isn't set"""
+    # localconfig.vdf can be several MB but PersonaName sits near the top,
+    # so read it in chunks and stop as soon as the field turns up
+    tail = b''
+    with open(path, 'rb') as f:
+        while True:
+            chunk = f.read(65536)
+            if not chunk:
+                break
+            data = tail + chunk
+            match = _PERSONA_RE.search(data)
+            if match:
+                return _vdf_unescape(match.group(1))
+            # Keep the end of the buffer in case the field is split across chunks
+            tail = data[-1024:]
+    import vdf
+    with open(path, 'r', encoding='utf-8') as f:
+        config = vdf.load(f)
+    return config.get('UserLocalConfigStore', {}).get('friends', {}).get('PersonaName')
+
+@functools.lru_cache(maxsize=16)
+def _list_ssfn_files(steam_folder, mtime):
+    """Map the last 8 digits of a Steam ID to its SSFN file in the Steam root folder"""
+    # SSFN files end with last 8 digits of Steam ID
+    with os.scandir(steam_folder) as entries:
+        return {entry.name[-8:]: entry.path for entry in entries
+                if entry.name.startswith("ssfn") and entry.is_file()}
+
 class SteamyLauncher:
     def __init__(self):
         self.config_file = get_config_path()
-        print(f"{Fore.CYAN}Initializing SteamyLauncher with config: {self.config_file}{Style.RESET_ALL}")
+        _log(f"{Fore.CYAN}Initializing SteamyLauncher with config: {self.config_file}{Style.RESET_ALL}")
         self.config = self.load_config()
+        # Track unsaved changes and what is already on disk to skip redundant writes
+        self._config_dirty = False
+        self._last_serialized = _dump_config(self.config)
         self.library_paths = self.config.get('library_paths', [])
+        # Mirror of library_paths for constant-time duplicate checks
+        self._library_paths_set = set(self.library_paths)
         self.current_user = self.config.get('current_user', '')
         self.steam_usernames = self.config.get('steam_usernames', {})
+        # Drive topology rarely changes during a session, so probe it once
+        self.drives = _present_drives()
+        # Steam executable location, remembered across runs
+        self._steam_exe = self.config.get('steam_exe')
+        # Steam users found in the libraries' userdata folders
+        self._users_cache = None
+        self._users_by_id = {}
+        # Games per library, keyed by the steamapps folder's modification time
+        self.games_cache = self.config.setdefault('games_cache', {})
+        # Game names by app id with the time they were looked up
+        self._name_cache = {}
+        # Last detected game process per app id, so the monitor can skip the process scan
+        self._game_procs = {}
+        # Config writes can come from the playtime saver thread as well as the menus
+        self._config_lock = threading.RLock()
+        # Playtime updates are written out by a background thread so the monitor never waits on disk
+        self._save_q = queue.Queue()
+        # Playtime not yet handed to the saver, in seconds per app id
+        self._playtime_dirty = {}
+        threading.Thread(target=self._save_worker, daemon=True).start()
+        # Game monitor key bindings
+        self._key_handlers = {
+            'Q': self._on_quit_game,
+            'K': self._on_kill,
+            'B': self._on_back,
+            'R': self._on_refresh,
+        }
 
     def load_config(self):
         """Load configuration from file"""
@@ -97,10 +439,10 @@ class SteamyLauncher:
         
         try:
             if os.path.exists(self.config_file):
-                print(f"{Fore.GREEN}Loading existing config from: {self.config_file}{Style.RESET_ALL}")
+                _log(f"{Fore.GREEN}Loading existing config from: {self.config_file}{Style.RESET_ALL}")
                 with open(self.config_file, 'r', encoding='utf-8') as f:
                     config = json.load(f)
-                    print(f"{Fore.GREEN}Loaded config successfully{Style.RESET_ALL}")
+                    _log(f"{Fore.GREEN}Loaded config successfully{Style.RESET_ALL}")
                     # Ensure required fields exist
                     if 'steam_usernames' not in config:
                         config['steam_usernames'] = {}
@@ -111,7 +453,7 @@ class SteamyLauncher:
                 print(f"{Fore.YELLOW}Config file not found. Creating new config at: {self.config_file}{Style.RESET_ALL}")
                 os.makedirs(os.path.dirname(self.config_file), exist_ok=True)
                 with open(self.config_file, 'w', encoding='utf-8') as f:
-                    json.dump(default_config, f, indent=4)
+                    f.write(_dump_config(default_config))
                 print(f"{Fore.GREEN}Created new config file{Style.RESET_ALL}")
                 return default_config
         except Exception as e:
@@ -119,61 +461,185 @@ class SteamyLauncher:
             return default_config
 
     def save_config(self):
-        """Save configuration to file"""
+        """Save configuration to file if it has changed"""
+        with self._config_lock:
+            self._write_config()
+
+    def _write_config(self):
+        """Write the configuration out if it has changed; callers hold the config lock"""
+        if not self._config_dirty:
+            return
         try:
-            print(f"{Fore.CYAN}Saving config to: {self.config_file}{Style.RESET_ALL}")
+            serialized = _dump_config(self.config)
+            if serialized == self._last_serialized:
+                self._config_dirty = False
+                return
+            _log(f"{Fore.CYAN}Saving config to: {self.config_file}{Style.RESET_ALL}")
             # Ensure the directory exists
             os.makedirs(os.path.dirname(self.config_file), exist_ok=True)
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(self.config, f, indent=4)
-            print(f"{Fore.GREEN}Config saved successfully{Style.RESET_ALL}")
+            # Write to a temporary file and swap it in so an interrupted save can't corrupt the config
+            tmp_file = self.config_file + '.tmp'
+            try:
+                with open(tmp_file, 'w', encoding='utf-8') as f:
+                    f.write(serialized)
+                os.replace(tmp_file, self.config_file)
+            except OSError:
+                # Don't leave a half-written temp file behind next to the config
+                if os.path.exists(tmp_file):
+                    os.remove(tmp_file)
+                raise
+            self._last_serialized = serialized
+            self._config_dirty = False
+            _log(f"{Fore.GREEN}Config saved successfully{Style.RESET_ALL}")
         except Exception as e:
             print(f"{Fore.RED}Error saving config: {str(e)}{Style.RESET_ALL}")
 
     def find_steam_libraries(self):
-        """Try to find Steam libraries in common locations"""
+        """Try to find Steam libraries, asking Steam itself before probing common locations"""
+        # The search reports on every candidate, so send it to the console in one write
+        with batched_stdout():
+            return self._search_steam_libraries()
+
+    def _search_steam_libraries(self):
+        """Search the registry, then the mounted drives, for Steam libraries"""
+        registered_paths = self._get_registered_libraries()
+        if registered_paths:
+            return registered_paths
+
         common_paths = []
-        # Add paths for all possible drives
-        for drive in 'ABCDEFGHIJKLMNOPQRSTUVWXYZ':
-            steam_paths = [
-                os.path.normpath(f"{drive}:{os.sep}Steam{os.sep}steamapps"),
-                os.path.normpath(f"{drive}:{os.sep}Program Files (x86){os.sep}Steam{os.sep}steamapps"),
-                os.path.normpath(f"{drive}:{os.sep}Program Files{os.sep}Steam{os.sep}steamapps"),
-                os.path.normpath(f"{drive}:{os.sep}SteamLibrary{os.sep}steamapps"),  # Add SteamLibrary path
-                os.path.normpath(f"{drive}:{os.sep}Steam Library{os.sep}steamapps")   # Add Steam Library path with space
-            ]
-            for path in steam_paths:
-                normalized_path = os.path.normpath(path)
-                print(f"{Fore.CYAN}Checking Steam folder: {normalized_path}{Style.RESET_ALL}")
-                if os.path.exists(os.path.dirname(normalized_path)):  # Check if Steam folder exists
-                    print(f"{Fore.GREEN}Found Steam folder: {os.path.dirname(normalized_path)}{Style.RESET_ALL}")
-                    if os.path.exists(normalized_path):  # Check if steamapps folder exists
-                        print(f"{Fore.GREEN}Found Steam library: {normalized_path}{Style.RESET_ALL}")
-                        common_paths.append(normalized_path)
-                    else:
-                        print(f"{Fore.YELLOW}Steam folder exists but no steamapps folder found at: {normalized_path}{Style.RESET_ALL}")
+        # Add paths for all mounted drives
+        for drive in self.drives:
+            # One listing of the drive root tells us which candidate folders can exist
+            try:
+                with os.scandir(f"{drive}:{os.sep}") as entries:
+                    root_folders = {entry.name.lower() for entry in entries if entry.is_dir()}
+            except OSError:
+                continue  # Drive is mounted but not ready, e.g. an empty card reader
+
+            for root_folder, suffix in _STEAM_LIBRARY_SUFFIXES:
+                if root_folder not in root_folders:
+                    continue
+                path = f"{drive}:\\{suffix}"
+                _log(f"{Fore.CYAN}Checking Steam folder: {path}{Style.RESET_ALL}")
+                if os.path.isdir(path):  # Check if steamapps folder exists
+                    path = os.path.normpath(path)
+                    print(f"{Fore.GREEN}Found Steam library: {path}{Style.RESET_ALL}")
+                    common_paths.append(path)
+                else:
+                    _log(f"{Fore.YELLOW}No steamapps folder found at: {path}{Style.RESET_ALL}")
         
         if not common_paths:
             print(f"{Fore.RED}No Steam libraries found in common locations.{Style.RESET_ALL}")
             print(f"{Fore.YELLOW}Please check if Steam is installed and note its location.{Style.RESET_ALL}")
             
             # Try to find steam.exe to help locate the installation
-            for drive in 'ABCDEFGHIJKLMNOPQRSTUVWXYZ':
-                steam_exe_paths = [
-                    os.path.normpath(f"{drive}:{os.sep}Steam{os.sep}steam.exe"),
-                    os.path.normpath(f"{drive}:{os.sep}Program Files (x86){os.sep}Steam{os.sep}steam.exe"),
-                    os.path.normpath(f"{drive}:{os.sep}Program Files{os.sep}Steam{os.sep}steam.exe")
-                ]
-                for exe_path in steam_exe_paths:
-                    if os.path.exists(exe_path):
-                        print(f"{Fore.GREEN}Found Steam executable at: {exe_path}{Style.RESET_ALL}")
-                        steam_folder = os.path.dirname(exe_path)
-                        steamapps_path = os.path.join(steam_folder, "steamapps")
-                        print(f"{Fore.YELLOW}Expected steamapps folder should be at: {steamapps_path}{Style.RESET_ALL}")
+            exe_path = self._find_steam_exe()
+            if exe_path:
+                print(f"{Fore.GREEN}Found Steam executable at: {exe_path}{Style.RESET_ALL}")
+                steam_folder = os.path.dirname(exe_path)
+                steamapps_path = os.path.join(steam_folder, "steamapps")
+                print(f"{Fore.YELLOW}Expected steamapps folder should be at: {steamapps_path}{Style.RESET_ALL}")
         
         return common_paths
 
+    def _get_registered_libraries(self):
+        """Get the library folders listed in Steam's libraryfolders.vdf"""
+        import vdf
+        steam_path = _get_steam_path_from_registry()
+        if not steam_path:
+            return []
+
+        libraryfolders_path = os.path.join(steam_path, "steamapps", "libraryfolders.vdf")
+        try:
+            with open(libraryfolders_path, 'r', encoding='utf-8') as f:
+                data = vdf.load(f)
+        except Exception as e:
+            _log(f"{Fore.YELLOW}Could not read {libraryfolders_path}: {str(e)}{Style.RESET_ALL}")
+            return []
+
+        # Older Steam clients wrote the root key as "LibraryFolders"
+        folders = next((value for key, value in data.items() if key.lower() == 'libraryfolders'), {})
+
+        roots = []
+        old_format = False
+        for key, folder in folders.items():
+            # Library entries are numbered; other keys hold Steam's own bookkeeping
+            if not key.isdigit():
+                continue
+            # New format entries are blocks with a "path" field, old ones are plain paths
+            if isinstance(folder, dict):
+                roots.append(folder.get('path', ''))
+            else:
+                roots.append(folder)
+                old_format = True
+        # The old format doesn't list Steam's own library, so add it in front
+        if old_format or not roots:
+            roots.insert(0, steam_path)
+
+        library_paths = []
+        seen = set()
+        for root in roots:
+            if not root:
+                continue
+            steamapps_path = os.path.normpath(os.path.join(root, "steamapps"))
+            # Windows paths are case-insensitive, so compare them that way
+            key = os.path.normcase(steamapps_path)
+            if key not in seen and os.path.isdir(steamapps_path):
+                seen.add(key)
+                print(f"{Fore.GREEN}Found Steam library: {steamapps_path}{Style.RESET_ALL}")
+                library_paths.append(steamapps_path)
+        return library_paths
+
+    def _find_steam_exe(self):
+        """Find the Steam executable, reusing the last known location while it still exists"""
+        if self._steam_exe and os.path.exists(self._steam_exe):
+            return self._steam_exe
+
+        # Steam records its own executable for the current user, so try that first
+        steam_exe = _get_steam_exe_from_registry()
+        if steam_exe and not os.path.exists(steam_exe):
+            steam_exe = None
+        if not steam_exe:
+            # A library's steamapps folder usually sits right next to steam.exe
+            steam_exe = next(
+                (candidate for candidate in (os.path.join(os.path.dirname(lib), "steam.exe") for lib in self.library_paths)
+                 if os.path.exists(candidate)),
+                None
+            )
+        if not steam_exe:
+            steam_path = _get_steam_path_from_registry()
+            if steam_path and os.path.exists(os.path.join(steam_path, "steam.exe")):
+                steam_exe = os.path.join(steam_path, "steam.exe")
+        if not steam_exe:
+            # Stop at the first hit rather than building every candidate path
+            steam_exe = next(
+                (path for drive in self.drives
+                 for path in (template.format(drive) for template in _STEAM_EXE_TEMPLATES)
+                 if os.path.exists(path)),
+                None
+            )
+
+        self._steam_exe = steam_exe
+        if steam_exe and self.config.get('steam_exe') != steam_exe:
+            # Remember the location so later runs can skip the search; this is only
+            # a cache, so it rides along with the next save instead of forcing one
+            self.config['steam_exe'] = steam_exe
+            self._config_dirty = True
+        return steam_exe
+
     def get_steam_users(self):
+        """Get list of Steam users, scanning the userdata folders only when needed"""
+        if self._users_cache is None:
+            self._users_cache = self._scan_steam_users()
+            self._users_by_id = {user['id']: user for user in self._users_cache}
+        return self._users_cache
+
+    def _get_user(self, user_id):
+        """Look up a Steam user by ID, or None if they aren't in any library"""
+        self.get_steam_users()
+        return self._users_by_id.get(user_id)
+
+    def _scan_steam_users(self):
         """Get list of Steam users from userdata folder"""
         users = []
         for library in self.library_paths:
@@ -181,52 +647,58 @@ class SteamyLauncher:
             steam_folder = os.path.dirname(library)
             userdata_path = os.path.join(steam_folder, "userdata")
             
-            if os.path.exists(userdata_path):
-                for user_id in os.listdir(userdata_path):
-                    if user_id.isdigit():
-                        # Try to get username from localconfig.vdf
-                        localconfig_path = os.path.join(userdata_path, user_id, "config", "localconfig.vdf")
-                        if os.path.exists(localconfig_path):
-                            try:
-                                with open(localconfig_path, 'r', encoding='utf-8') as f:
-                                    config = vdf.load(f)
-                                    username = config.get('UserLocalConfigStore', {}).get('friends', {}).get('PersonaName', f'User {user_id}')
-                                    users.append({'id': user_id, 'name': username})
-                            except:
-                                users.append({'id': user_id, 'name': f'User {user_id}'})
+            # Libraries outside Steam's own folder have no userdata; let scandir report
+            # that instead of checking for the folder first
+            try:
+                entries = os.scandir(userdata_path)
+            except OSError:
+                continue
+            with entries:
+                for entry in entries:
+                    user_id = entry.name
+                    if not user_id.isdigit() or not entry.is_dir():
+                        continue
+                    # Try to get username from localconfig.vdf
+                    localconfig_path = os.path.join(entry.path, "config", "localconfig.vdf")
+                    try:
+                        mtime = os.stat(localconfig_path).st_mtime_ns
+                    except OSError:
+                        continue
+                    try:
+                        username = _read_persona_name(localconfig_path, mtime) or f'User {user_id}'
+                        users.append({'id': user_id, 'name': username})
+                    except:
+                        users.append({'id': user_id, 'name': f'User {user_id}'})
         return users
 
     def get_key(self):
         """Get a single keypress without requiring Enter"""
         key = msvcrt.getch()
-        if key == b'\xe0':  # Arrow key prefix
-            key = msvcrt.getch()
-            if key == b'H':  # Up arrow
-                return 'UP'
-            elif key == b'P':  # Down arrow
-                return 'DOWN'
-            elif key == b'K':  # Left arrow
-                return 'LEFT'
-            elif key == b'M':  # Right arrow
-                return 'RIGHT'
-        return key.decode('utf-8').upper()
+        if key == b'\xe0' or key == b'\x00':  # Arrow/function key prefix
+            return _KEY_MAP.get(msvcrt.getch(), '')
+        if b' ' <= key <= b'~':  # Printable ASCII needs no decoding
+            return chr(key[0]).upper()
+        return key.decode('utf-8', 'replace').upper()
 
     def get_number_input(self, max_value):
         """Get numeric input without requiring Enter"""
         number = ""
         while True:
-            key = msvcrt.getch().decode('utf-8')
+            # getwch returns text directly, so there is no per-key decode and
+            # arrow-key prefixes can't raise UnicodeDecodeError
+            key = msvcrt.getwch()
             if key == '\r':  # Enter key
                 break
             elif key == '\b':  # Backspace
                 if number:
                     number = number[:-1]
-                    msvcrt.putch(b'\b')
-                    msvcrt.putch(b' ')
-                    msvcrt.putch(b'\b')
+                    # Erase the last digit with a single write
+                    sys.stdout.write('\b \b')
+                    sys.stdout.flush()
             elif key.isdigit():
                 number += key
-                msvcrt.putch(key.encode())  # Print the digit immediately
+                sys.stdout.write(key)  # Print the digit immediately
+                sys.stdout.flush()
         print()  # New line after input
         return number
 
@@ -238,30 +710,37 @@ class SteamyLauncher:
             "Select Steam User",
             "Back to Main Menu"
         ]
+        # The option set is fixed, so pad each row once up front
+        option_rows = [f"│   {option:<110}" for option in options]
+        selected_rows = [f"│ {Fore.WHITE}> {option:<110}{Style.RESET_ALL}" for option in options]
         
+        redraw = True
         while True:
-            os.system('cls' if os.name == 'nt' else 'clear')
-            print(f"{Fore.BLUE}┌{'─' * 118}")
-            print(f"│{' ' * 118}")
-            print(f"│{' ' * 45}{Fore.WHITE}SETTINGS MENU{Style.RESET_ALL}{' ' * 55}")
-            print(f"│{' ' * 118}")
-            print(f"├{'─' * 118}")
-            
-            # Settings menu options display
-            for i, option in enumerate(options):
-                if i == selected_option:
-                    print(f"│ {Fore.WHITE}> {option}{Style.RESET_ALL}{' ' * (110 - len(option))}")
-                else:
-                    print(f"│   {option}{' ' * (110 - len(option))}")
-            
-            print(f"└{'─' * 118}")
-            print(f"\n{Fore.BLUE}Use arrow keys to navigate, Enter to select: {Style.RESET_ALL}", end='', flush=True)
+            if redraw:
+                # Build the whole frame and write it in one go
+                frame = []
+                frame.append(_MENU_TOP)
+                frame.append(_BLANK_ROW)
+                frame.append(_SETTINGS_TITLE)
+                frame.append(_BLANK_ROW)
+                frame.append(_MENU_MID)
+                
+                # Settings menu options display
+                for i in range(len(options)):
+                    frame.append(selected_rows[i] if i == selected_option else option_rows[i])
+                
+                frame.append(_MENU_BOT)
+                frame.append(f"\n{Fore.BLUE}{_NAV_PROMPT}{Style.RESET_ALL}")
+                _write_frame(frame)
+                redraw = False
             
             key = self.get_key()
-            if key == 'UP':
-                selected_option = (selected_option - 1) % len(options)
-            elif key == 'DOWN':
-                selected_option = (selected_option + 1) % len(options)
+            if key in ('UP', 'DOWN'):
+                # Moving the highlight only touches two rows, so skip the full redraw
+                previous = selected_option
+                step = -1 if key == 'UP' else 1
+                selected_option = (selected_option + step) % len(options)
+                _redraw_selection(option_rows, selected_rows, previous, selected_option)
             elif key == '\r':  # Enter key
                 if selected_option == 0:
                     self.manage_library_paths()
@@ -269,34 +748,36 @@ class SteamyLauncher:
                     self.select_steam_user()
                 elif selected_option == 2:
                     break
+                redraw = True
 
     def manage_library_paths(self):
         """Manage Steam library paths"""
         while True:
-            os.system('cls' if os.name == 'nt' else 'clear')
-            print(f"{Fore.BLUE}┌{'─' * 118}")
-            print(f"│{' ' * 118}")
-            print(f"│{' ' * 45}{Fore.WHITE}LIBRARY PATH MANAGEMENT{Style.RESET_ALL}{' ' * 45}")
-            print(f"│{' ' * 118}")
-            print(f"├{'─' * 118}")
+            frame = []
+            frame.append(_MENU_TOP)
+            frame.append(_BLANK_ROW)
+            frame.append(_LIBRARY_TITLE)
+            frame.append(_BLANK_ROW)
+            frame.append(_MENU_MID)
             
             # Show current paths with better formatting
-            print(f"│ {Fore.BLUE}Current Library Paths:{Style.RESET_ALL}")
+            frame.append(f"│ {Fore.BLUE}Current Library Paths:{Style.RESET_ALL}")
             if self.library_paths:
                 for idx, path in enumerate(self.library_paths, 1):
                     normalized_path = os.path.normpath(path)
-                    print(f"│ {Fore.WHITE}{idx}. {normalized_path}{Style.RESET_ALL}")
+                    frame.append(f"│ {Fore.WHITE}{idx}. {normalized_path}{Style.RESET_ALL}")
             else:
-                print(f"│ {Fore.RED}No paths configured{Style.RESET_ALL}")
+                frame.append(f"│ {Fore.RED}No paths configured{Style.RESET_ALL}")
             
-            print(f"├{'─' * 118}")
-            print(f"│ {Fore.WHITE}1{Style.RESET_ALL} - Add new path{' ' * 100}")
-            print(f"│ {Fore.WHITE}2{Style.RESET_ALL} - Remove path{' ' * 100}")
-            print(f"│ {Fore.WHITE}3{Style.RESET_ALL} - Auto-detect paths{' ' * 95}")
-            print(f"│ {Fore.WHITE}4{Style.RESET_ALL} - Back{' ' * 105}")
-            print(f"└{'─' * 118}")
+            frame.append(_MENU_MID)
+            frame.append(f"│ {Fore.WHITE}1{Style.RESET_ALL} - Add new path{' ' * 100}")
+            frame.append(f"│ {Fore.WHITE}2{Style.RESET_ALL} - Remove path{' ' * 100}")
+            frame.append(f"│ {Fore.WHITE}3{Style.RESET_ALL} - Auto-detect paths{' ' * 95}")
+            frame.append(f"│ {Fore.WHITE}4{Style.RESET_ALL} - Back{' ' * 105}")
+            frame.append(_MENU_BOT)
             
-            print(f"\n{Fore.BLUE}Press a key: {Style.RESET_ALL}", end='', flush=True)
+            frame.append(f"\n{Fore.BLUE}Press a key: {Style.RESET_ALL}")
+            _write_frame(frame)
             choice = self.get_key()
             
             if choice == '1':
@@ -307,72 +788,52 @@ class SteamyLauncher:
                 path_obj = Path(path)
                 normalized_path = str(path_obj.resolve())  # Get absolute path
                 
-                # Debug information
-                print(f"\n{Fore.YELLOW}Path Information:{Style.RESET_ALL}")
-                print(f"Original path: {path}")
-                print(f"Path object: {path_obj}")
-                print(f"Absolute path: {normalized_path}")
-                print(f"Path separators: {os.sep}")
-                print(f"Drive: {path_obj.drive}")
-                print(f"Parent: {path_obj.parent}")
-                print(f"Name: {path_obj.name}")
+                # Debug information, only shown in verbose mode
+                _log(f"\n{Fore.YELLOW}Path Information:{Style.RESET_ALL}")
+                _log(f"Original path: {path}")
+                _log(f"Path object: {path_obj}")
+                _log(f"Absolute path: {normalized_path}")
+                _log(f"Path separators: {os.sep}")
+                _log(f"Drive: {path_obj.drive}")
+                _log(f"Parent: {path_obj.parent}")
+                _log(f"Name: {path_obj.name}")
                 
                 try:
-                    # First check if the drive exists
-                    drive_exists = os.path.exists(path_obj.drive + os.sep)
-                    print(f"Drive exists: {drive_exists}")
-                    
-                    if not drive_exists:
-                        print(f"{Fore.RED}Drive {path_obj.drive} does not exist.{Style.RESET_ALL}")
-                        print("\nPress any key to continue...")
-                        self.get_key()
-                        continue
-                    
-                    # Check each part of the path
-                    current_path = path_obj.drive + os.sep
-                    path_parts = path_obj.parts[1:]  # Skip drive
-                    
-                    for part in path_parts:
-                        current_path = os.path.join(current_path, part)
-                        exists = os.path.exists(current_path)
-                        print(f"Checking {current_path}: {'Exists' if exists else 'Does not exist'}")
-                        
-                        if not exists:
-                            print(f"{Fore.RED}Path does not exist: {current_path}{Style.RESET_ALL}")
-                            print(f"{Fore.YELLOW}Please verify the path and try again.{Style.RESET_ALL}")
-                            print("\nPress any key to continue...")
-                            self.get_key()
-                            return
-                    
-                    # If we get here, the full path exists
-                    print(f"{Fore.GREEN}Full path exists: {normalized_path}{Style.RESET_ALL}")
-                    
-                    # Check if it's a directory
-                    if not os.path.isdir(normalized_path):
-                        print(f"{Fore.RED}Path exists but is not a directory: {normalized_path}{Style.RESET_ALL}")
-                        print("\nPress any key to continue...")
-                        self.get_key()
-                        return
-                    
-                    # Check if we can list contents
+                    # A single directory read both validates the path and answers
+                    # whether it holds any manifests, stopping at the first one
                     try:
-                        contents = os.listdir(normalized_path)
-                        print(f"{Fore.GREEN}Directory is accessible{Style.RESET_ALL}")
-                        print(f"Contents: {contents}")
+                        entries = os.scandir(normalized_path)
+                    except FileNotFoundError:
+                        print(f"{Fore.RED}Path does not exist: {normalized_path}{Style.RESET_ALL}")
+                        print(f"{Fore.YELLOW}Please verify the path and try again.{Style.RESET_ALL}")
+                        entries = None
+                    except NotADirectoryError:
+                        print(f"{Fore.RED}Path exists but is not a directory: {normalized_path}{Style.RESET_ALL}")
+                        entries = None
                     except PermissionError:
                         print(f"{Fore.RED}Permission denied. Try running as administrator.{Style.RESET_ALL}")
+                        entries = None
+
+                    if entries is None:
                         print("\nPress any key to continue...")
                         self.get_key()
-                        return
-                    
-                    # Check for .acf files
-                    has_acf = any(f.endswith('.acf') for f in contents)
-                    print(f"Contains .acf files: {has_acf}")
+                        continue
+
+                    has_acf = False
+                    with entries:
+                        for entry in entries:
+                            if entry.name.endswith('.acf') and entry.is_file(follow_symlinks=False):
+                                has_acf = True
+                                break
+                    _log(f"Contains .acf files: {has_acf}")
                     
                     if has_acf:
-                        if normalized_path not in self.library_paths:
+                        if normalized_path not in self._library_paths_set:
+                            self._library_paths_set.add(normalized_path)
                             self.library_paths.append(normalized_path)
                             self.config['library_paths'] = self.library_paths
+                            self._users_cache = None
+                            self._config_dirty = True
                             try:
                                 self.save_config()
                                 print(f"{Fore.GREEN}Path added successfully!{Style.RESET_ALL}")
@@ -401,7 +862,10 @@ class SteamyLauncher:
                     idx = int(number)
                     if 1 <= idx <= len(self.library_paths):
                         removed = self.library_paths.pop(idx - 1)
+                        self._library_paths_set.discard(removed)
                         self.config['library_paths'] = self.library_paths
+                        self._users_cache = None
+                        self._config_dirty = True
                         self.save_config()
                         print(f"{Fore.GREEN}Removed: {removed}{Style.RESET_ALL}")
                     else:
@@ -414,10 +878,13 @@ class SteamyLauncher:
                 if auto_paths:
                     print(f"{Fore.GREEN}Found Steam libraries:{Style.RESET_ALL}")
                     for path in auto_paths:
-                        if path not in self.library_paths:
+                        if path not in self._library_paths_set:
+                            self._library_paths_set.add(path)
                             self.library_paths.append(path)
+                            self._config_dirty = True
                             print(f"{Fore.WHITE}Added: {path}{Style.RESET_ALL}")
                     self.config['library_paths'] = self.library_paths
+                    self._users_cache = None
                     self.save_config()
                 else:
                     print(f"{Fore.RED}No Steam libraries found.{Style.RESET_ALL}")
@@ -432,34 +899,38 @@ class SteamyLauncher:
     def select_steam_user(self):
         """Select Steam user"""
         selected_option = 0
+        # Rescan so newly added accounts show up
+        self._users_cache = None
         users = self.get_steam_users()
         if not users:
             print(f"{Fore.RED}No Steam users found.{Style.RESET_ALL}")
             return
+        user_rows = [f"│   {user['name']:<110}" for user in users]
+        selected_rows = [f"│ {Fore.WHITE}> {user['name']:<110}{Style.RESET_ALL}" for user in users]
+
+        frame = []
+        frame.append(_MENU_TOP)
+        frame.append(_BLANK_ROW)
+        frame.append(_USER_TITLE)
+        frame.append(_BLANK_ROW)
+        frame.append(_MENU_MID)
+        
+        # Select Steam user menu display
+        for idx in range(len(users)):
+            frame.append(selected_rows[idx] if idx == selected_option else user_rows[idx])
+        
+        frame.append(_MENU_BOT)
+        frame.append(f"\n{Fore.BLUE}{_NAV_PROMPT}{Style.RESET_ALL}")
+        _write_frame(frame)
 
         while True:
-            os.system('cls' if os.name == 'nt' else 'clear')
-            print(f"{Fore.BLUE}┌{'─' * 118}")
-            print(f"│{' ' * 118}")
-            print(f"│{' ' * 45}{Fore.WHITE}SELECT STEAM USER{Style.RESET_ALL}{' ' * 55}")
-            print(f"│{' ' * 118}")
-            print(f"├{'─' * 118}")
-            
-            # Select Steam user menu display
-            for idx, user in enumerate(users):
-                if idx == selected_option:
-                    print(f"│ {Fore.WHITE}> {user['name']}{Style.RESET_ALL}{' ' * (110 - len(user['name']))}")
-                else:
-                    print(f"│   {user['name']}{' ' * (110 - len(user['name']))}")
-            
-            print(f"└{'─' * 118}")
-            print(f"\n{Fore.BLUE}Use arrow keys to navigate, Enter to select: {Style.RESET_ALL}", end='', flush=True)
-            
             key = self.get_key()
-            if key == 'UP':
-                selected_option = (selected_option - 1) % len(users)
-            elif key == 'DOWN':
-                selected_option = (selected_option + 1) % len(users)
+            if key in ('UP', 'DOWN'):
+                # Only the previously and newly highlighted rows need repainting
+                previous = selected_option
+                step = -1 if key == 'UP' else 1
+                selected_option = (selected_option + step) % len(users)
+                _redraw_selection(user_rows, selected_rows, previous, selected_option)
             elif key == '\r':  # Enter key
                 selected_user = users[selected_option]
                 self.current_user = selected_user['id']
@@ -472,6 +943,7 @@ class SteamyLauncher:
                 self.config['current_user'] = self.current_user
                 self.steam_usernames[self.current_user] = username
                 self.config['steam_usernames'] = self.steam_usernames
+                self._config_dirty = True
                 self.save_config()
                 
                 print(f"\n{Fore.GREEN}Selected user: {selected_user['name']}{Style.RESET_ALL}")
@@ -480,35 +952,75 @@ class SteamyLauncher:
                 self.get_key()
                 break
 
-    def get_installed_games(self):
-        """Get list of installed Steam games"""
+    def get_installed_games(self, force=False):
+        """Get list of installed Steam games, rescanning every library when force is set"""
         if not self.library_paths:
             print(f"{Fore.RED}No library paths configured. Please add paths in settings.{Style.RESET_ALL}")
             return []
 
-        games = []
-        for library in self.library_paths:
-            print(f"{Fore.CYAN}Scanning library: {library}{Style.RESET_ALL}")
-            # Read appmanifest files
-            for file in os.listdir(library):
-                if file.startswith("appmanifest_") and file.endswith(".acf"):
-                    manifest_path = os.path.join(library, file)
-                    try:
-                        with open(manifest_path, 'r', encoding='utf-8') as f:
-                            manifest = vdf.load(f)
-                            app_data = manifest.get('AppState', {})
-                            games.append({
-                                'name': app_data.get('name', 'Unknown Game'),
-                                'appid': app_data.get('appid'),
-                                'install_dir': app_data.get('installdir', '')
-                            })
-                    except Exception as e:
-                        print(f"{Fore.RED}Error reading {file}: {str(e)}{Style.RESET_ALL}")
+        cached_mtimes = {library: entry.get('mtime') for library, entry in self.games_cache.items()}
+
+        # Libraries often live on separate disks, so scan them concurrently; with a
+        # single library there is nothing to overlap, so skip the thread pool
+        if len(self.library_paths) == 1:
+            results = [self._scan_library(self.library_paths[0], force)]
+        else:
+            with ThreadPoolExecutor(max_workers=len(self.library_paths)) as executor:
+                results = list(executor.map(functools.partial(self._scan_library, force=force), self.library_paths))
+        # Pad each name for the menu grid once here rather than on every redraw; the
+        # copies keep the display field out of the games cache saved in the config
+        games = [dict(game, display=f"{game['name'][:35]:<35}") for library_games in results for game in library_games]
 
+        # Drop cache entries for removed libraries and mark anything rescanned for
+        # the next save rather than rewriting the config on every refresh
+        for library in list(self.games_cache):
+            if library not in self._library_paths_set:
+                del self.games_cache[library]
+        current_mtimes = {library: entry.get('mtime') for library, entry in self.games_cache.items()}
+        if current_mtimes != cached_mtimes:
+            self._config_dirty = True
         return sorted(games, key=lambda x: x['name'])
 
+    def _scan_library(self, library, force=False):
+        """Get the games installed in a single steamapps folder"""
+        # Installing or removing a game usually bumps the folder's mtime, so an
+        # unchanged mtime is a good sign the cached list is current. It can miss
+        # in-place manifest rewrites and is coarse on FAT, so force skips the cache
+        mtime = os.stat(library).st_mtime_ns
+        cached = self.games_cache.get(library)
+        if not force and cached and cached.get('mtime') == mtime:
+            return cached['games']
+
+        _log(f"{Fore.CYAN}Scanning library: {library}{Style.RESET_ALL}")
+        games = []
+        complete = True
+        # Read appmanifest files, using the directory entries to skip extra stat calls
+        with os.scandir(library) as entries:
+            for entry in entries:
+                name = entry.name
+                if not (name.startswith("appmanifest_") and name.endswith(".acf")):
+                    continue
+                if not entry.is_file(follow_symlinks=False):
+                    continue
+                try:
+                    app_data = _read_app_manifest(entry.path, entry.stat().st_mtime_ns)
+                    games.append({
+                        'name': app_data.get('name', 'Unknown Game'),
+                        'appid': app_data.get('appid'),
+                        'install_dir': app_data.get('installdir', '')
+                    })
+                except Exception as e:
+                    print(f"{Fore.RED}Error reading {name}: {str(e)}{Style.RESET_ALL}")
+                    complete = False
+
+        # Only cache a clean scan so unreadable manifests are retried next time
+        if complete:
+            self.games_cache[library] = {'mtime': mtime, 'games': games}
+        return games
+
     def _get_logged_in_user(self):
         """Get the currently logged in Steam user by checking the registry"""
+        import winreg
         try:
             key = winreg.OpenKey(winreg.HKEY_CURRENT_USER, r"Software\Valve\Steam\ActiveProcess")
             active_user = winreg.QueryValueEx(key, "ActiveUser")[0]
@@ -528,6 +1040,7 @@ class SteamyLauncher:
 
     def _get_login_token(self, user_id):
         """Get Steam login token for the specified user"""
+        import vdf
         try:
             config_path = self._get_steam_config_path()
             if not config_path:
@@ -551,26 +1064,45 @@ class SteamyLauncher:
             for library in self.library_paths:
                 steam_folder = os.path.dirname(library)
                 # SSFN files are in Steam root folder
-                for file in os.listdir(steam_folder):
-                    if file.startswith("ssfn") and file.endswith(user_id[-8:]):  # SSFN files end with last 8 digits of Steam ID
-                        return os.path.join(steam_folder, file)
+                ssfn_file = _list_ssfn_files(steam_folder, os.stat(steam_folder).st_mtime_ns).get(user_id[-8:])
+                if ssfn_file:
+                    return ssfn_file
             return None
         except:
             return None
 
     def _is_steam_running(self):
         """Check if Steam is running by looking for its processes"""
-        try:
-            output = subprocess.check_output(['tasklist'], text=True)
-            return 'steam.exe' in output.lower()
-        except:
-            return False
+        # Walking the process table directly avoids spawning tasklist and parsing its output
+        return self._get_process_by_name("steam.exe") is not None
+
+    def _start_steam(self, steam_exe, *args):
+        """Start Steam detached from our console without going through a shell"""
+        return subprocess.Popen(
+            [steam_exe, *args],
+            creationflags=subprocess.DETACHED_PROCESS | subprocess.CREATE_NEW_PROCESS_GROUP,
+            close_fds=True,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL
+        )
+
+    def _kill_steam(self):
+        """Force Steam to exit without going through a shell or flashing a console window"""
+        subprocess.run(
+            ['taskkill', '/F', '/IM', 'steam.exe'],
+            creationflags=subprocess.CREATE_NO_WINDOW,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL
+        )
 
     def _get_process_by_name(self, name):
         """Get process by name, returns None if not found"""
+        import psutil
         for proc in psutil.process_iter(['name', 'pid']):
             try:
-                if proc.info['name'].lower() == name.lower():
+                # name is None for processes we aren't allowed to inspect
+                if (proc.info['name'] or '').lower() == name.lower():
                     return proc
             except (psutil.NoSuchProcess, psutil.AccessDenied):
                 pass
@@ -578,29 +1110,53 @@ class SteamyLauncher:
 
     def _get_game_process(self, app_id):
         """Get the game process using various detection methods"""
-        # Common process name patterns for Steam games
+        # Reuse the process found last time while it's still alive; is_running also
+        # catches the pid having been handed to a different process since
+        cached = self._game_procs.get(str(app_id))
+        if cached is not None:
+            if cached.is_running():
+                return cached
+            del self._game_procs[str(app_id)]
+        
+        game_proc = self._find_game_process(app_id)
+        if game_proc is not None:
+            self._game_procs[str(app_id)] = game_proc
+        return game_proc
+
+    def _find_game_process(self, app_id):
+        """Scan the process table for the game's process"""
+        import psutil
+        # Common process name patterns for Steam games, in order of preference
         possible_names = [
             f"steam_{app_id}.exe",
             f"game_{app_id}.exe",
             f"app_{app_id}.exe"
         ]
+        wanted = set(possible_names)
+        wanted.add("steam.exe")
+        
+        # Collect every process of interest in a single sweep of the process table,
+        # keeping parent ids so Steam's children can be found without more syscalls
+        matches = {}
+        processes = []
+        for proc in psutil.process_iter(['name', 'pid', 'ppid']):
+            name = (proc.info['name'] or '').lower()
+            processes.append((proc, name))
+            if name in wanted and name not in matches:
+                matches[name] = proc
         
-        # Try to find the process
         for name in possible_names:
-            proc = self._get_process_by_name(name)
-            if proc:
-                return proc
+            if name in matches:
+                return matches[name]
         
         # If not found by common names, try to find by checking Steam's active process
-        steam_proc = self._get_process_by_name("steam.exe")
+        steam_proc = matches.get("steam.exe")
         if steam_proc:
             # Check children of Steam process
-            try:
-                for child in steam_proc.children():
-                    if child.name().lower() not in ["steamservice.exe", "steamwebhelper.exe"]:
-                        return child
-            except (psutil.NoSuchProcess, psutil.AccessDenied):
-                pass
+            blocklist = {"steamservice.exe", "steamwebhelper.exe", "steam.exe"}
+            for proc, name in processes:
+                if proc.info['ppid'] == steam_proc.pid and name not in blocklist:
+                    return proc
         
         return None
 
@@ -617,19 +1173,76 @@ class SteamyLauncher:
         """Get total playtime for a game"""
         return self.config.get('playtime', {}).get(str(app_id), 0)
 
-    def _save_playtime(self, app_id, session_time):
-        """Save playtime for a game"""
+    def _add_playtime(self, app_id, session_time):
+        """Add playtime for a game to the in-memory config"""
+        with self._config_lock:
+            app_id_str = str(app_id)
+            current_total = self.config.get('playtime', {}).get(app_id_str, 0)
+            self.config.setdefault('playtime', {})[app_id_str] = current_total + session_time
+            self._config_dirty = True
+
+    def _record_playtime(self, app_id, session_time):
+        """Note playtime for a game without saving it yet"""
         app_id_str = str(app_id)
-        current_total = self.config.get('playtime', {}).get(app_id_str, 0)
-        self.config.setdefault('playtime', {})[app_id_str] = current_total + session_time
-        self.save_config()
+        self._playtime_dirty[app_id_str] = self._playtime_dirty.get(app_id_str, 0) + session_time
+
+    def _flush_playtime(self, wait=False):
+        """Hand recorded playtime to the saver thread, optionally waiting until it's on disk"""
+        while self._playtime_dirty:
+            self._save_q.put(self._playtime_dirty.popitem())
+        if wait:
+            self._save_q.join()
+
+    def _save_worker(self):
+        """Apply queued playtime updates and save them in the background"""
+        while True:
+            pending = [self._save_q.get()]
+            # Fold in anything else that queued up meanwhile so it all goes out in one write
+            while True:
+                try:
+                    pending.append(self._save_q.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                with self._config_lock:
+                    for app_id, session_time in pending:
+                        self._add_playtime(app_id, session_time)
+                    self.save_config()
+            except Exception as e:
+                print(f"{Fore.RED}Error saving playtime: {str(e)}{Style.RESET_ALL}")
+            finally:
+                # Always settle the queue so the saver keeps running and waiters aren't stuck
+                for _ in pending:
+                    self._save_q.task_done()
+
+    def _on_quit_game(self, game_proc):
+        """Ask the game to close, killing it if it doesn't, and leave the monitor"""
+        if game_proc:
+            game_proc.terminate()
+            time.sleep(1)
+            if game_proc.is_running():
+                game_proc.kill()
+        return _MONITOR_EXIT
+
+    def _on_kill(self, game_proc):
+        """Kill the game process and keep monitoring"""
+        if game_proc:
+            game_proc.kill()
+
+    def _on_back(self, game_proc):
+        """Leave the monitor without touching the game"""
+        return _MONITOR_EXIT
+
+    def _on_refresh(self, game_proc):
+        """Redraw the monitor from scratch"""
+        return _MONITOR_REDRAW
 
     def launch_game(self, app_id):
         """Launch a Steam game by its AppID"""
+        import psutil
         print(f"\n{Fore.CYAN}=== Starting Game Launch Process ==={Style.RESET_ALL}")
         
-        users = self.get_steam_users()
-        current_user = next((user for user in users if user['id'] == self.current_user), None)
+        current_user = self._get_user(self.current_user)
         
         if not current_user:
             print(f"{Fore.RED}Could not find user information. Please select a user again.{Style.RESET_ALL}")
@@ -637,20 +1250,7 @@ class SteamyLauncher:
 
         try:
             # Find Steam executable
-            steam_exe = None
-            for drive in 'ABCDEFGHIJKLMNOPQRSTUVWXYZ':
-                steam_paths = [
-                    os.path.normpath(f"{drive}:{os.sep}Steam{os.sep}steam.exe"),
-                    os.path.normpath(f"{drive}:{os.sep}Program Files (x86){os.sep}Steam{os.sep}steam.exe"),
-                    os.path.normpath(f"{drive}:{os.sep}Program Files{os.sep}Steam{os.sep}steam.exe")
-                ]
-                for path in steam_paths:
-                    if os.path.exists(path):
-                        steam_exe = path
-                        break
-                if steam_exe:
-                    break
-
+            steam_exe = self._find_steam_exe()
             if not steam_exe:
                 print(f"{Fore.RED}Could not find Steam executable. Please make sure Steam is installed.{Style.RESET_ALL}")
                 return
@@ -661,7 +1261,7 @@ class SteamyLauncher:
 
             if not steam_running or logged_in_user != current_user['id']:
                 if steam_running:
-                    subprocess.run(['taskkill', '/F', '/IM', 'steam.exe'], shell=True)
+                    self._kill_steam()
                     time.sleep(3)
                 
                 username = self.steam_usernames.get(self.current_user)
@@ -670,14 +1270,14 @@ class SteamyLauncher:
                     username = input().strip()
                     self.steam_usernames[self.current_user] = username
                     self.config['steam_usernames'] = self.steam_usernames
+                    self._config_dirty = True
                     self.save_config()
                 
-                subprocess.Popen(f'"{steam_exe}" -login {username}', shell=True)
+                self._start_steam(steam_exe, '-login', username)
                 time.sleep(5)
 
             # Launch game
-            game_command = f'"{steam_exe}" -applaunch {app_id}'
-            subprocess.Popen(game_command, shell=True)
+            self._start_steam(steam_exe, '-applaunch', str(app_id))
             time.sleep(5)  # Wait for game to start
 
             # Game monitoring
@@ -685,136 +1285,166 @@ class SteamyLauncher:
             last_save = start_time
             game_name = self._get_game_name(app_id)
             total_playtime = self._get_total_playtime(app_id)
-            last_cpu_check = 0
-            cpu_history = []
+            cpu_proc = None  # Process object the CPU readings are taken from
+            # Last 10 CPU readings for the average, with their sum kept alongside
+            cpu_history = deque(maxlen=10)
+            cpu_total = 0.0
             game_was_running = False
             running_time = 0
             
-            while True:
-                os.system('cls' if os.name == 'nt' else 'clear')
-                current_time = time.time()
-                session_time = current_time - start_time
-                
-                # Get game process and system info
-                game_proc = self._get_game_process(app_id)
-                
-                # Track if game was running and for how long
-                if game_proc:
-                    game_was_running = True
-                    running_time = session_time
-                elif game_was_running and running_time >= 15:
-                    # Show closing message if game ran for at least 15 seconds
-                    os.system('cls' if os.name == 'nt' else 'clear')
-                    print(f"\n{Fore.BLUE}╔{'═' * 50}╗")
-                    print(f"║{' ' * 15}{Fore.CYAN}Game Session Ended{Fore.BLUE}{' ' * 17}║")
-                    print(f"╠{'═' * 50}╣")
-                    print(f"║ {Fore.WHITE}Game:{' ' * 4}{Fore.YELLOW}{game_name[:35]}{' ' * (41 - len(game_name[:35]))}{Fore.BLUE}║")
-                    print(f"║ {Fore.WHITE}Played for:{' ' * 1}{Fore.GREEN}{self._format_time(running_time)}{' ' * (41 - len(self._format_time(running_time)))}{Fore.BLUE}║")
-                    print(f"║{' ' * 50}║")
-                    print(f"║ {Fore.CYAN}Hope you enjoyed playing!{' ' * 27}{Fore.BLUE}║")
-                    print(f"╚{'═' * 50}╝{Style.RESET_ALL}")
-                    print("\nPress any key to continue...")
-                    self.get_key()
-                    break
-                
-                # Calculate CPU and memory usage
-                cpu_percent = 0
-                memory_mb = 0
-                if game_proc:
-                    try:
-                        # Only update CPU every second to get more accurate readings
-                        if current_time - last_cpu_check >= 1:
-                            cpu_percent = game_proc.cpu_percent(interval=0.1)
-                            cpu_history.append(cpu_percent)
-                            # Keep only last 10 readings for average
-                            if len(cpu_history) > 10:
-                                cpu_history.pop(0)
-                            last_cpu_check = current_time
-                        
-                        memory_info = game_proc.memory_info()
-                        memory_mb = memory_info.rss / (1024 * 1024)
-                    except (psutil.NoSuchProcess, psutil.AccessDenied):
-                        pass
-
-                # Calculate average CPU usage
-                avg_cpu = sum(cpu_history) / len(cpu_history) if cpu_history else 0
-
-                # Save playtime every 5 minutes
-                if current_time - last_save >= 300:
-                    self._save_playtime(app_id, current_time - last_save)
-                    last_save = current_time
-
-                # Display monitoring interface with box drawing characters
-                print(f"\n{Fore.BLUE}╔{'═' * 50}╗")
-                print(f"║{' ' * 15}{Fore.CYAN}Game Session Monitor{Fore.BLUE}{' ' * 16}║")
-                print(f"╠{'═' * 50}╣")
-                
-                # Game info section
-                print(f"║ {Fore.WHITE}Game:{' ' * 4}{Fore.YELLOW}{game_name[:35]}{' ' * (41 - len(game_name[:35]))}{Fore.BLUE}║")
-                print(f"║ {Fore.WHITE}Status:{' ' * 3}{Fore.GREEN if game_proc else Fore.RED}{'Running' if game_proc else 'Starting/Not detected'}{' ' * (41 - len('Running' if game_proc else 'Starting/Not detected'))}{Fore.BLUE}║")
-                
-                # Time section
-                print(f"╠{'═' * 50}╣")
-                print(f"║ {Fore.CYAN}Time Tracking{' ' * 38}{Fore.BLUE}║")
-                print(f"║ {Fore.WHITE}Session:{' ' * 2}{Fore.YELLOW}{self._format_time(session_time)}{' ' * (41 - len(self._format_time(session_time)))}{Fore.BLUE}║")
-                print(f"║ {Fore.WHITE}Total:{' ' * 4}{Fore.YELLOW}{self._format_time(total_playtime + session_time)}{' ' * (41 - len(self._format_time(total_playtime + session_time)))}{Fore.BLUE}║")
-                
-                # Performance section
-                if game_proc:
-                    print(f"╠{'═' * 50}╣")
-                    print(f"║ {Fore.CYAN}Performance Metrics{' ' * 33}{Fore.BLUE}║")
+            # Colours used by the per-tick rows, bound once for the whole session
+            blue, white, yellow, green, red = Fore.BLUE, Fore.WHITE, Fore.YELLOW, Fore.GREEN, Fore.RED
+            # The game row doesn't change during the session
+            game_row = f"║ {white}Game:{' ' * 4}{yellow}{game_name[:35]:<41}{blue}║"
+            
+            # Rows drawn on the previous tick; only the ones that change get rewritten
+            frame = []
+            # What the box showed last time it was drawn
+            last_signature = None
+            # Key presses arrive from a listener thread so the loop can sleep until one comes in
+            keys = queue.Queue()
+            stop_keys = threading.Event()
+            key_listener = threading.Thread(target=_listen_for_keys, args=(keys, stop_keys), daemon=True)
+            key_listener.start()
+            try:
+                while True:
+                    current_time = time.time()
+                    session_time = current_time - start_time
                     
-                    # CPU usage with color based on load
-                    cpu_color = Fore.GREEN if avg_cpu < 50 else (Fore.YELLOW if avg_cpu < 80 else Fore.RED)
-                    cpu_text = f"{avg_cpu:.1f}%"
-                    print(f"║ {Fore.WHITE}CPU Usage:{' ' * 1}{cpu_color}{cpu_text}{' ' * (41 - len(cpu_text))}{Fore.BLUE}║")
+                    # Get game process and system info
+                    game_proc = self._get_game_process(app_id)
                     
-                    # Memory usage with color based on amount
-                    mem_color = Fore.GREEN if memory_mb < 1024 else (Fore.YELLOW if memory_mb < 2048 else Fore.RED)
-                    mem_text = f"{memory_mb:.1f} MB"
-                    print(f"║ {Fore.WHITE}Memory:{' ' * 4}{mem_color}{mem_text}{' ' * (41 - len(mem_text))}{Fore.BLUE}║")
-                
-                # Controls section
-                print(f"╠{'═' * 50}╣")
-                print(f"║ {Fore.CYAN}Controls{' ' * 42}{Fore.BLUE}║")
-                print(f"║ {Fore.YELLOW}[Q]{Fore.WHITE} Force quit game{' ' * 33}{Fore.BLUE}║")
-                print(f"║ {Fore.YELLOW}[K]{Fore.WHITE} Kill game process{' ' * 31}{Fore.BLUE}║")
-                print(f"║ {Fore.YELLOW}[R]{Fore.WHITE} Refresh stats{' ' * 35}{Fore.BLUE}║")
-                print(f"║ {Fore.YELLOW}[B]{Fore.WHITE} Back to menu{' ' * 36}{Fore.BLUE}║")
-                print(f"╚{'═' * 50}╝{Style.RESET_ALL}")
-                
-                if msvcrt.kbhit():
-                    key = msvcrt.getch().decode('utf-8').upper()
-                    if key == 'Q':
-                        if game_proc:
-                            game_proc.terminate()
-                            time.sleep(1)
-                            if game_proc.is_running():
-                                game_proc.kill()
+                    # Track if game was running and for how long
+                    if game_proc:
+                        game_was_running = True
+                        running_time = session_time
+                    elif game_was_running and running_time >= 15:
+                        # Show closing message if game ran for at least 15 seconds
+                        clear_screen()
+                        print(f"\n{_MONITOR_TOP}")
+                        print(_SESSION_ENDED_TITLE)
+                        print(_MONITOR_SEP)
+                        print(game_row)
+                        print(f"║ {white}Played for:{' ' * 1}{green}{self._format_time(running_time):<41}{blue}║")
+                        print(_SESSION_ENDED_FOOTER)
+                        print("\nPress any key to continue...")
+                        keys.get()
                         break
-                    elif key == 'K':
+                    
+                    # Calculate CPU and memory usage
+                    cpu_percent = 0
+                    memory_mb = 0
+                    if game_proc:
+                        try:
+                            # Non-blocking reads measure against the previous call on the same
+                            # Process object, so stick with one per pid and prime it first
+                            primed = cpu_proc is not None and cpu_proc.pid == game_proc.pid
+                            if not primed:
+                                cpu_proc = game_proc
+                            # Fetch the process stats once and read CPU and memory from the snapshot
+                            with cpu_proc.oneshot():
+                                cpu_percent = cpu_proc.cpu_percent(interval=None)
+                                memory_info = cpu_proc.memory_info()
+                            if primed:
+                                # The deque drops its oldest reading when full, so take it out of the sum first
+                                if len(cpu_history) == cpu_history.maxlen:
+                                    cpu_total -= cpu_history[0]
+                                cpu_history.append(cpu_percent)
+                                cpu_total += cpu_percent
+                            
+                            memory_mb = memory_info.rss / (1024 * 1024)
+                        except (psutil.NoSuchProcess, psutil.AccessDenied):
+                            pass
+
+                    # Calculate average CPU usage
+                    avg_cpu = cpu_total / len(cpu_history) if cpu_history else 0
+
+                    # Save playtime every 15 minutes; the rest is written when the session ends
+                    if current_time - last_save >= 900:
+                        self._record_playtime(app_id, current_time - last_save)
+                        self._flush_playtime()
+                        last_save = current_time
+
+                    # Format everything the box shows once per tick
+                    session_text = self._format_time(session_time)
+                    total_text = self._format_time(total_playtime + session_time)
+                    cpu_text = mem_text = cpu_color = mem_color = None
+                    if game_proc:
+                        # CPU usage with color based on load
+                        cpu_color = green if avg_cpu < 50 else (yellow if avg_cpu < 80 else red)
+                        cpu_text = f"{avg_cpu:.1f}%"
+                        # Memory usage with color based on amount
+                        mem_color = green if memory_mb < 1024 else (yellow if memory_mb < 2048 else red)
+                        mem_text = f"{memory_mb:.1f} MB"
+                    
+                    # Nothing to redraw unless something on screen would actually change
+                    signature = (bool(game_proc), session_text, total_text, cpu_text, cpu_color, mem_text, mem_color)
+                    if not frame or signature != last_signature:
+                        last_signature = signature
+                        
+                        # Build the monitoring interface with box drawing characters
+                        lines = ["", _MONITOR_TOP, _MONITOR_TITLE, _MONITOR_SEP]
+                        
+                        # Game info section
+                        lines.append(game_row)
+                        status_text = 'Running' if game_proc else 'Starting/Not detected'
+                        lines.append(f"║ {white}Status:{' ' * 3}{green if game_proc else red}{status_text:<41}{blue}║")
+                        
+                        # Time section
+                        lines.append(_MONITOR_SEP)
+                        lines.append(_MONITOR_TIME_HEADER)
+                        lines.append(f"║ {white}Session:{' ' * 2}{yellow}{session_text:<41}{blue}║")
+                        lines.append(f"║ {white}Total:{' ' * 4}{yellow}{total_text:<41}{blue}║")
+                        
+                        # Performance section
                         if game_proc:
-                            game_proc.kill()
-                    elif key == 'B':
+                            lines.append(_MONITOR_SEP)
+                            lines.append(_MONITOR_PERF_HEADER)
+                            lines.append(f"║ {white}CPU Usage:{' ' * 1}{cpu_color}{cpu_text:<41}{blue}║")
+                            lines.append(f"║ {white}Memory:{' ' * 4}{mem_color}{mem_text:<41}{blue}║")
+                        
+                        # Controls section
+                        lines.extend(_MONITOR_CONTROLS)
+                        _update_frame(frame, lines)
+                        frame = lines
+                    
+                    # Wait out the rest of the tick, waking straight away on a key press
+                    try:
+                        key = keys.get(timeout=1.0).upper()
+                    except queue.Empty:
+                        key = None
+                    handler = self._key_handlers.get(key)
+                    action = handler(game_proc) if handler else None
+                    if action == _MONITOR_EXIT:
                         break
-                    elif key == 'R':
-                        continue
-
-                time.sleep(1)
-                
-            # Save final playtime
-            self._save_playtime(app_id, time.time() - last_save)
+                    elif action == _MONITOR_REDRAW:
+                        # Force a full redraw on the next tick
+                        frame = []
+            finally:
+                stop_keys.set()
+                key_listener.join()
+                # Save the rest of the session even if monitoring failed, waiting for
+                # the saver so nothing is lost on the way out
+                self._record_playtime(app_id, time.time() - last_save)
+                self._flush_playtime(wait=True)
 
         except Exception as e:
             print(f"{Fore.RED}Error launching game: {str(e)}{Style.RESET_ALL}")
             print("\nPress any key to continue...")
             self.get_key()
 
-    def _get_game_name(self, app_id):
-        """Get game name from app_id"""
-        games = self.get_installed_games()
-        game = next((g for g in games if str(g['appid']) == str(app_id)), None)
-        return game['name'] if game else f"Game {app_id}"
+    def _get_game_name(self, app_id, max_age=60):
+        """Get game name from app_id, reusing recent lookups"""
+        now = time.time()
+        cached = self._name_cache.get(str(app_id))
+        if cached and now - cached[0] < max_age:
+            return cached[1]
+        
+        # One library scan answers every app id, so remember all of them
+        for g in self.get_installed_games():
+            self._name_cache[str(g['appid'])] = (now, g['name'])
+        cached = self._name_cache.get(str(app_id))
+        return cached[1] if cached and cached[0] == now else f"Game {app_id}"
 
     def display_menu(self, games):
         """Display the game selection menu"""
@@ -836,113 +1466,69 @@ class SteamyLauncher:
 {' ' * 35}                                                \\/__/ {Style.RESET_ALL}"""
         
         while True:
-            # Clear screen
-            os.system('cls' if os.name == 'nt' else 'clear')
-            
+            # The frame write clears the screen itself
+            frame = []
             # Print centered logo
-            print("\n" + logo + "\n")
+            frame.append("\n" + logo + "\n")
 
             # Games list with modern styling
-            print(f"{Fore.BLUE}┌{'─' * 118}")
+            frame.append(_MENU_TOP)
             
             if not self.library_paths:
                 # Show welcome message when no libraries are configured
-                print(f"│{' ' * 118}")
-                print(f"│{' ' * 35}{Fore.YELLOW}Welcome to Steamy!{Style.RESET_ALL}{' ' * 65}")
-                print(f"│{' ' * 25}{Fore.WHITE}To get started, configure your Steam libraries using the options below.{Style.RESET_ALL}{' ' * 25}")
-                print(f"│{' ' * 30}{Fore.WHITE}Press [S] for Settings or [A] to Auto-detect libraries.{Style.RESET_ALL}{' ' * 35}")
-                print(f"│{' ' * 118}")
+                frame.extend(_WELCOME_ROWS)
             elif not self.current_user and self.library_paths:
                 # Show welcome message when libraries are configured but no user is selected
-                print(f"│{' ' * 118}")
-                print(f"│{' ' * 35}{Fore.YELLOW}Almost there!{Style.RESET_ALL}{' ' * 65}")
-                print(f"│{' ' * 25}{Fore.WHITE}Please select a Steam user to continue.{Style.RESET_ALL}{' ' * 45}")
-                print(f"│{' ' * 118}")
-                print(f"└{'─' * 118}{Style.RESET_ALL}")
-                print(f"\n{Fore.BLUE}Press any key to select a user...{Style.RESET_ALL}")
+                frame.extend(_SELECT_USER_ROWS)
+                frame.append(_MENU_END)
+                frame.append(f"\n{Fore.BLUE}Press any key to select a user...{Style.RESET_ALL}\n")
+                _write_frame(frame)
                 self.get_key()
                 self.select_steam_user()
                 games = self.get_installed_games()  # Refresh games list after user selection
                 continue
             elif games:
-                print(f"│ {Fore.BLUE}Installed Games{' ' * 100}")
-                print(f"├{'─' * 118}")
+                frame.append(_GAMES_HEADER)
+                frame.append(_MENU_MID)
                 
                 # Show games in a 3-column grid format
-                for i in range(0, len(games), 3):
-                    game1 = games[i]
-                    game2 = games[i + 1] if i + 1 < len(games) else None
-                    game3 = games[i + 2] if i + 2 < len(games) else None
-                    
-                    # Add selection indicator with clear highlighting
-                    if i == selected_game:
-                        prefix1 = f"{Fore.CYAN}> {i+1:2d}.{Style.RESET_ALL}"
-                        name1 = f"{Fore.CYAN}{game1['name'][:35]:<35}{Style.RESET_ALL}"
-                    else:
-                        prefix1 = f"{Fore.WHITE}  {i+1:2d}.{Style.RESET_ALL}"
-                        name1 = f"{Fore.WHITE}{game1['name'][:35]:<35}{Style.RESET_ALL}"
-                        
-                    if game2:
-                        if i + 1 == selected_game:
-                            prefix2 = f"{Fore.CYAN}> {i+2:2d}.{Style.RESET_ALL}"
-                            name2 = f"{Fore.CYAN}{game2['name'][:35]:<35}{Style.RESET_ALL}"
-                        else:
-                            prefix2 = f"{Fore.WHITE}  {i+2:2d}.{Style.RESET_ALL}"
-                            name2 = f"{Fore.WHITE}{game2['name'][:35]:<35}{Style.RESET_ALL}"
-                            
-                    if game3:
-                        if i + 2 == selected_game:
-                            prefix3 = f"{Fore.CYAN}> {i+3:2d}.{Style.RESET_ALL}"
-                            name3 = f"{Fore.CYAN}{game3['name'][:35]:<35}{Style.RESET_ALL}"
-                        else:
-                            prefix3 = f"{Fore.WHITE}  {i+3:2d}.{Style.RESET_ALL}"
-                            name3 = f"{Fore.WHITE}{game3['name'][:35]:<35}{Style.RESET_ALL}"
-                    
-                    if game2 and game3:
-                        print(f"{Fore.BLUE}│{Style.RESET_ALL} {prefix1} {name1} {prefix2} {name2} {prefix3} {name3}")
-                    elif game2:
-                        print(f"{Fore.BLUE}│{Style.RESET_ALL} {prefix1} {name1} {prefix2} {name2} {' ' * 40}")
-                    else:
-                        print(f"{Fore.BLUE}│{Style.RESET_ALL} {prefix1} {name1} {' ' * 75}")
+                cells = [_format_game_cell(i, game, i == selected_game) for i, game in enumerate(games)]
+                for start in range(0, len(cells), 3):
+                    frame.append(f"{Fore.BLUE}│{Style.RESET_ALL} " + " ".join(cells[start:start + 3]))
                 
                 # Add padding if needed
                 if len(games) % 3 != 0:
-                    print(f"{Fore.BLUE}│{' ' * 118}")
+                    frame.append(f"{Fore.BLUE}{_BLANK_ROW}")
             else:
-                print(f"│{' ' * 118}")
-                print(f"│{' ' * 25}{Fore.RED}No games found in your configured libraries.{Style.RESET_ALL}{' ' * 45}")
-                print(f"│{' ' * 25}{Fore.WHITE}Press [R] to refresh or [S] to check library paths in Settings.{Style.RESET_ALL}{' ' * 30}")
-                print(f"│{' ' * 118}")
+                frame.extend(_NO_GAMES_ROWS)
             
             # Quick actions bar
-            print(f"{Fore.BLUE}├{'─' * 118}")
+            frame.append(_MENU_MID_BLUE)
             
-            # Get user info for status display
+            # Get user info for status display (cached, so redraws don't rescan userdata)
             user_info = ""
             if self.current_user:
-                users = self.get_steam_users()
-                current_user_name = next((user['name'] for user in users if user['id'] == self.current_user), 'Unknown User')
+                current_user = self._get_user(self.current_user)
+                current_user_name = current_user['name'] if current_user else 'Unknown User'
                 user_info = f"{Fore.BLUE}{current_user_name}{Style.RESET_ALL}"
             else:
                 user_info = f"{Fore.BLUE}No User Selected{Style.RESET_ALL}"
             
             # Show Quick Actions with user info on the right
-            print(f"│ {Fore.BLUE}Quick Actions:{Style.RESET_ALL}{' ' * 70}{user_info}")
+            frame.append(f"│ {Fore.BLUE}Quick Actions:{Style.RESET_ALL}{' ' * 70}{user_info}")
             
             # Show quick actions based on state
-            if not self.library_paths:
-                print(f"│ {Fore.YELLOW}[S]{Style.RESET_ALL} Settings | {Fore.YELLOW}[A]{Style.RESET_ALL} Auto-detect | {Fore.YELLOW}[Q]{Style.RESET_ALL} Quit")
-            else:
-                print(f"│ {Fore.YELLOW}[S]{Style.RESET_ALL} Settings | {Fore.YELLOW}[R]{Style.RESET_ALL} Refresh | {Fore.YELLOW}[Q]{Style.RESET_ALL} Quit")
+            frame.append(_QUICK_ACTIONS if self.library_paths else _QUICK_ACTIONS_SETUP)
             
             library_info = f"{Fore.BLUE}Libraries: {Style.RESET_ALL}{len(self.library_paths)}"
-            print(f"└{'─' * 118}{Style.RESET_ALL}")
+            frame.append(_MENU_END)
             
             # Navigation prompt
             if games and self.current_user:
-                print(f"\n{Fore.BLUE}Use arrow keys to select a game, Enter to launch, or quick action keys: {Style.RESET_ALL}", end='', flush=True)
+                frame.append(f"\n{Fore.BLUE}Use arrow keys to select a game, Enter to launch, or quick action keys: {Style.RESET_ALL}")
             else:
-                print(f"\n{Fore.BLUE}Press a key to select an action: {Style.RESET_ALL}", end='', flush=True)
+                frame.append(f"\n{Fore.BLUE}Press a key to select an action: {Style.RESET_ALL}")
+            _write_frame(frame)
             
             # Handle input
             key = self.get_key()
@@ -950,16 +1536,21 @@ class SteamyLauncher:
             # Handle quick actions
             if key == 'S':  # Settings
                 self.settings_menu()
-                games = self.get_installed_games()
+                self._name_cache.clear()
+                games = self.get_installed_games(force=True)
             elif key == 'R' and self.library_paths:  # Refresh
-                games = self.get_installed_games()
+                self._name_cache.clear()
+                games = self.get_installed_games(force=True)
             elif key == 'A' and not self.library_paths:  # Auto-detect
                 auto_paths = self.find_steam_libraries()
                 if auto_paths:
                     for path in auto_paths:
-                        if path not in self.library_paths:
+                        if path not in self._library_paths_set:
+                            self._library_paths_set.add(path)
                             self.library_paths.append(path)
+                            self._config_dirty = True
                     self.config['library_paths'] = self.library_paths
+                    self._users_cache = None
                     self.save_config()
                     games = self.get_installed_games()
             elif key == 'Q':  # Quit
@@ -988,6 +1579,9 @@ def main():
         # Set console title
         set_console_title("Steamy - Steam Game Launcher")
         
+        # Let the console handle cursor movement escapes for partial redraws
+        enable_vt_mode()
+        
         print(f"{Fore.YELLOW}Initializing Steam Launcher...{Style.RESET_ALL}")
         launcher = SteamyLauncher()
         print(f"{Fore.GREEN}Steam Launcher initialized successfully.{Style.RESET_ALL}")
@@ -998,6 +1592,8 @@ def main():
         
         print(f"{Fore.YELLOW}Starting main menu...{Style.RESET_ALL}")
         launcher.display_menu(games)
+        # Write out any cached data that hasn't been saved yet
+        launcher.save_config()
     except Exception as e:
         print(f"\n{Fore.RED}Error occurred: {str(e)}{Style.RESET_ALL}")
         print(f"{Fore.RED}Please check if you have the required permissions and Steam is installed.{Style.RESET_ALL}")